@@ -2,12 +2,56 @@
 TideWatch Flask Application
 Main server for tide, weather, and astronomy data visualization
 """
-from flask import Flask, render_template, jsonify, send_from_directory, request
+# gevent must patch the stdlib before anything imports sockets so the
+# NOAA/weather HTTP calls become cooperative under gunicorn -k gevent
+try:
+    from gevent import monkey
+    monkey.patch_all()
+except ImportError:
+    pass
+
+from flask import Flask, make_response, render_template, send_from_directory, request, Response
 from flask_cors import CORS
+from flask_caching import Cache
+from concurrent.futures import Future
 from datetime import datetime
+import functools
+import hashlib
+import signal
+import logging
+import tempfile
+from logging.handlers import RotatingFileHandler
 import subprocess
 import platform
 import os
+import threading
+import time
+
+try:
+    import orjson
+    def _dumps(payload):
+        return orjson.dumps(payload)
+except ImportError:
+    # Fall back to stdlib json if orjson isn't installed
+    import json as _stdlib_json
+    def _dumps(payload):
+        # default=str matches orjson's native datetime handling closely
+        # enough for the 'dt' fields on tide predictions
+        return _stdlib_json.dumps(payload, separators=(',', ':'),
+                                  default=str).encode()
+
+
+# Log to a rotating file - print() serialized threads on the stdout lock
+# and formatted messages even when nobody was reading them
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s %(name)s %(levelname)s %(message)s',
+    handlers=[RotatingFileHandler(
+        os.path.join(tempfile.gettempdir(), 'tidewatch.log'),
+        maxBytes=1_000_000, backupCount=2
+    )]
+)
+logger = logging.getLogger(__name__)
 
 from config import Config
 from weather_service import WeatherService
@@ -22,164 +66,405 @@ app = Flask(__name__,
 CORS(app)
 app.config.from_object(Config)
 
+# Compact JSON for any remaining jsonify calls
+app.json.compact = True
+app.json.sort_keys = False
+
+# In-process response cache - upstream data only changes every few minutes,
+# so kiosk polling should mostly hit memory instead of NOAA/weather.gov
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache'})
+
+
+def _only_ok(resp):
+    """response_filter for cache.cached - never pin an error for the
+    full TTL; a transient upstream failure should be retried on the
+    next poll, not served for up to an hour"""
+    return getattr(resp, 'status_code', 200) == 200
+
+# Transparent gzip for JSON - tide prediction payloads compress ~10x and the
+# Pi's CPU cost at level 4 is negligible next to the WiFi bandwidth saved
+try:
+    from flask_compress import Compress
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_LEVEL'] = 4
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    Compress(app)
+except ImportError:
+    pass
+
+# Serve the frontend assets from the WSGI layer with whitenoise - much
+# cheaper than routing every CSS/JS/image request through send_from_directory.
+# The Flask routes below stay as a fallback when whitenoise isn't installed
+# (or when nginx fronts the app in production and handles statics itself).
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'frontend')
+try:
+    from whitenoise import WhiteNoise
+    app.wsgi_app = WhiteNoise(app.wsgi_app, root=_FRONTEND_DIR, max_age=3600,
+                              index_file='index.html', autorefresh=False)
+except ImportError:
+    pass
+
+
+def ojson(payload, status=200):
+    """Serialize an API payload with orjson (much faster than jsonify on the Pi)"""
+    return Response(_dumps(payload), status=status, mimetype='application/json')
+
+
+_ERR_TPL = b'{"status":"error","message":%s}'
+
+
+def err(message, status=500):
+    """Error response from a byte template - the failure path gets hot during
+    NOAA outages, so skip the dict build and full encode"""
+    return Response(_ERR_TPL % _dumps(str(message)), status=status,
+                    mimetype='application/json')
+
+
+def ok(data):
+    """Standard {"status":"ok","data":...} wrapper without an outer dict"""
+    return Response(b'{"status":"ok","data":' + _dumps(data) + b'}',
+                    mimetype='application/json')
+
+# Session and worker pool live in io_singletons so services imported
+# standalone (scripts, __main__ blocks) share the exact same objects
+from io_singletons import SESSION as SHARED_SESSION, IO_POOL as _ioexec
+
 # Initialize services
 weather_service = WeatherService(
     app.config['LATITUDE'],
-    app.config['LONGITUDE']
+    app.config['LONGITUDE'],
+    session=SHARED_SESSION
 )
 
 tide_service = TideService(
     prediction_station=app.config['NOAA_PREDICTION_STATION'],
     observation_station=app.config['NOAA_OBSERVATION_STATION'],
-    timezone=app.config['TIMEZONE']
+    timezone=app.config['TIMEZONE'],
+    session=SHARED_SESSION
 )
 
 astronomy_service = AstronomyService(
     app.config['LATITUDE'],
-    app.config['LONGITUDE']
+    app.config['LONGITUDE'],
+    session=SHARED_SESSION
 )
 
 wifi_service = WiFiService()
 
 
+# In-flight request coalescing - when identical requests arrive in parallel
+# (kiosk polling + preflight), only the first one does the work
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _snapshot_response(result):
+    """Freeze a handler result into (body, status, headers) for sharing"""
+    resp = make_response(result)
+    return resp.get_data(), resp.status_code, list(resp.headers)
+
+
+def _rebuild_response(snapshot):
+    """Build a caller-private Response from a shared snapshot"""
+    body, status, headers = snapshot
+    return Response(body, status=status, headers=headers)
+
+
+def singleflight(func):
+    """Let concurrent identical requests share one handler execution
+
+    The shared value is a (body, status, headers) snapshot rather than the
+    Response object itself: after-request hooks mutate responses per client
+    (the ETag hook's make_conditional can turn one into a bodiless 304), so
+    handing the same instance to coalesced callers would let one client's
+    conditional headers strip the body everyone else receives.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = request.path + '?' + request.query_string.decode()
+        with _inflight_lock:
+            future = _inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                _inflight[key] = future
+
+        if not is_leader:
+            return _rebuild_response(future.result())
+
+        try:
+            snapshot = _snapshot_response(func(*args, **kwargs))
+            future.set_result(snapshot)
+            return _rebuild_response(snapshot)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+    return wrapper
+
+
+
+# ============================================================================
+# Background pre-warm
+# ============================================================================
+# A daemon thread refreshes the expensive upstream blobs on their natural
+# cadence, so read endpoints normally serve straight from memory instead of
+# paying worst-case NOAA/weather.gov latency on a cache miss.
+
+LATEST = {}
+_latest_lock = threading.RLock()
+
+_REFRESH_JOBS = {
+    'current': (60, lambda: tide_service.get_current_water_level()),
+    'predictions': (600, lambda: tide_service.get_tide_predictions(days=7)),
+    'weather': (600, lambda: weather_service.get_weather()),
+    'astronomy': (3600, lambda: astronomy_service.get_astronomy_data()),
+}
+
+
+def _store_latest(key, value):
+    if value:
+        with _latest_lock:
+            LATEST[key] = (time.monotonic(), value)
+
+
+def _get_latest(key, max_age):
+    """Return the pre-warmed value for key, or None if missing/stale"""
+    with _latest_lock:
+        entry = LATEST.get(key)
+    if entry and time.monotonic() - entry[0] < max_age:
+        return entry[1]
+    return None
+
+
+# How soon a failed refresh is retried - matters at boot, when the
+# kiosk often comes up before WiFi does
+_REFRESH_RETRY_SECONDS = 30
+
+
+def _refresher_loop():
+    # -inf, not 0.0: time.monotonic() starts near zero after boot, so a
+    # zero sentinel would postpone the very first fetch by one interval
+    last_run = {key: float('-inf') for key in _REFRESH_JOBS}
+    while True:
+        now = time.monotonic()
+        for key, (interval, fetch) in _REFRESH_JOBS.items():
+            if now - last_run[key] >= interval:
+                try:
+                    value = fetch()
+                except Exception as e:
+                    value = None
+                    logger.warning("Refresher error for %s: %s", key, e)
+                if value:
+                    _store_latest(key, value)
+                    last_run[key] = now
+                else:
+                    # Schedule a short retry instead of waiting out the
+                    # full interval with nothing cached
+                    last_run[key] = now - interval + _REFRESH_RETRY_SECONDS
+        time.sleep(5)
+
+
+_refresher_started = False
+_refresher_lock = threading.Lock()
+
+
+@app.before_request
+def _ensure_refresher():
+    """Start the refresher on first request (works under gunicorn too)"""
+    global _refresher_started
+    if not _refresher_started:
+        with _refresher_lock:
+            if not _refresher_started:
+                threading.Thread(target=_refresher_loop, daemon=True).start()
+                _refresher_started = True
+
+
+
+@app.after_request
+def _keepalive(resp):
+    """Advertise keep-alive so the kiosk browser multiplexes its polls
+    over one TCP connection (gunicorn/nginx handle this themselves)"""
+    resp.headers.setdefault('Connection', 'keep-alive')
+    resp.headers.setdefault('Keep-Alive', 'timeout=30, max=1000')
+    return resp
+
+
+@app.after_request
+def _etag_api_responses(resp):
+    """Serve 304s for unchanged /api/* GETs - polls cost ~100 bytes on the wire
+
+    The kiosk polls every few seconds but the underlying data changes every
+    6-60 minutes, so most polls can skip the multi-KB JSON body entirely.
+    """
+    if (request.method == 'GET' and request.path.startswith('/api/')
+            and resp.status_code == 200 and not resp.direct_passthrough):
+        etag = hashlib.blake2b(resp.get_data(), digest_size=8).hexdigest()
+        resp.set_etag(etag)
+        resp.headers.setdefault('Cache-Control', 'max-age=30')
+        return resp.make_conditional(request)
+    return resp
+
+
 @app.route('/')
 def index():
     """Serve the main frontend page"""
     return send_from_directory('../frontend', 'index.html')
 
 
+# /api/config and the /api/health skeleton never change after startup,
+# so serialize them once at import instead of on every poll
+_CONFIG_BODY = _dumps({
+    'location': {
+        'name': Config.LOCATION_NAME,
+        'latitude': Config.LATITUDE,
+        'longitude': Config.LONGITUDE,
+        'station_id': Config.NOAA_PREDICTION_STATION,
+        'observation_station': Config.NOAA_OBSERVATION_STATION
+    }
+})
+
+_HEALTH_TPL = _dumps({
+    'status': 'ok',
+    'timestamp': '%TS%',
+    'location': Config.LOCATION_NAME
+})
+
+# The timestamp only needs 1-second resolution, so a watchdog polling at
+# 1 Hz reuses the same encoded string instead of a datetime round-trip
+_health_ts_cache = [0, b'']
+
+
 @app.route('/api/config')
 def get_config():
     """Return location configuration for frontend"""
-    return jsonify({
-        'location': {
-            'name': app.config['LOCATION_NAME'],
-            'latitude': app.config['LATITUDE'],
-            'longitude': app.config['LONGITUDE'],
-            'station_id': app.config['NOAA_PREDICTION_STATION'],
-            'observation_station': app.config['NOAA_OBSERVATION_STATION']
-        }
-    })
+    return Response(_CONFIG_BODY, mimetype='application/json')
+
+
+def _health_body():
+    """Health payload bytes, timestamp cached at 1-second resolution"""
+    t = int(time.time())
+    if t != _health_ts_cache[0]:
+        _health_ts_cache[1] = datetime.fromtimestamp(t).isoformat().encode()
+        _health_ts_cache[0] = t
+    return _HEALTH_TPL.replace(b'%TS%', _health_ts_cache[1])
 
 
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'ok',
-        'timestamp': datetime.now().isoformat(),
-        'location': app.config['LOCATION_NAME']
-    })
+    return Response(_health_body(), mimetype='application/json')
 
 
 @app.route('/api/tide')
+@cache.cached(timeout=300, response_filter=_only_ok)
+@singleflight
 def get_tide_data():
     """Get all tide data - current level, predictions, status"""
     try:
-        data = tide_service.get_all_tide_data()
+        # Fire the two independent NOAA fetches concurrently, then derive
+        # the remaining views from the single prediction list - no repeat
+        # fetches behind the helpers
+        f_current = _ioexec.submit(tide_service.get_current_water_level)
+        f_predictions = _ioexec.submit(tide_service.get_tide_predictions, days=7)
+
+        predictions = f_predictions.result(timeout=15)
+        current = f_current.result(timeout=15)
+        next_tides = tide_service.get_next_tides(predictions)
+        data = {
+            'current': current,
+            'predictions': predictions,
+            'next_high': next_tides['next_high'] if next_tides else None,
+            'next_low': next_tides['next_low'] if next_tides else None,
+            'todays_tides': tide_service.get_todays_tides(predictions),
+            'status': tide_service.calculate_tide_status(predictions, current),
+            'prediction_station': tide_service.prediction_station,
+            'observation_station': tide_service.observation_station,
+            'station_name': 'Seattle (nearest available)',
+            'last_update': datetime.now().isoformat()
+        }
         
         if data:
-            return jsonify({
+            return ojson({
                 'status': 'ok',
                 'data': data,
                 'location': app.config['LOCATION_NAME']
             })
         
-        return jsonify({
-            'status': 'error',
-            'message': 'Failed to fetch tide data'
-        }), 500
+        return err('Failed to fetch tide data', 500)
             
     except Exception as e:
-        print(f"Error in /api/tide: {e}")
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        logger.exception("Error in /api/tide")
+        return err(str(e), 500)
 
 
 @app.route('/api/tide/current')
+@cache.cached(timeout=60, response_filter=_only_ok)
 def get_current_tide():
     """Get just the current water level"""
     try:
-        current = tide_service.get_current_water_level()
+        current = _get_latest('current', 300) or tide_service.get_current_water_level()
         
         if current:
-            return jsonify({
-                'status': 'ok',
-                'data': current
-            })
+            return ok(current)
         
-        return jsonify({
-            'status': 'error',
-            'message': 'No current data available'
-        }), 404
+        return err('No current data available', 404)
             
     except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        return err(str(e), 500)
 
 
 @app.route('/api/tide/predictions')
+@cache.cached(timeout=300, response_filter=_only_ok)
+@singleflight
 def get_tide_predictions():
     """Get tide predictions for the next 7 days"""
     try:
-        predictions = tide_service.get_tide_predictions(days=7)
+        predictions = _get_latest('predictions', 1800) or tide_service.get_tide_predictions(days=7)
         
         if predictions:
-            return jsonify({
-                'status': 'ok',
-                'data': predictions
-            })
+            return ok(predictions)
         
-        return jsonify({
-            'status': 'error',
-            'message': 'No predictions available'
-        }), 404
+        return err('No predictions available', 404)
             
     except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        return err(str(e), 500)
 
 
 @app.route('/api/weather')
+@cache.cached(timeout=600, response_filter=_only_ok)
+@singleflight
 def get_weather():
     """Get current weather data"""
-    data = weather_service.get_weather()
+    data = _get_latest('weather', 1800) or weather_service.get_weather()
     
     if data:
-        return jsonify({
+        return ojson({
             'status': 'ok',
             'data': data,
             'location': app.config['LOCATION_NAME']
         })
     
-    return jsonify({
-        'status': 'error',
-        'message': 'Failed to fetch weather data'
-    }), 500
+    return err('Failed to fetch weather data', 500)
 
 
 @app.route('/api/astronomy')
+@cache.cached(timeout=3600, response_filter=_only_ok)
+@singleflight
 def get_astronomy_data():
     """Get astronomy data (sun/moon rise/set, moon phase)"""
-    data = astronomy_service.get_astronomy_data()
+    data = _get_latest('astronomy', 7200) or astronomy_service.get_astronomy_data()
     
     if data:
-        return jsonify({
+        return ojson({
             'status': 'ok',
             'data': data,
             'location': app.config['LOCATION_NAME']
         })
     
-    return jsonify({
-        'status': 'error',
-        'message': 'Failed to fetch astronomy data'
-    }), 500
+    return err('Failed to fetch astronomy data', 500)
 
 
 # ============================================================================
@@ -187,35 +472,34 @@ def get_astronomy_data():
 # ============================================================================
 
 @app.route('/api/wifi/status')
+@cache.cached(timeout=10, response_filter=_only_ok)
 def get_wifi_status():
     """Get current WiFi connection status"""
     try:
         status = wifi_service.get_status()
-        return jsonify({
-            'status': 'ok',
-            'data': status
-        })
+        return ok(status)
     except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        return err(str(e), 500)
 
 
 @app.route('/api/wifi/scan')
+@cache.cached(timeout=30, response_filter=_only_ok)
+@singleflight
 def scan_wifi_networks():
     """Scan for available WiFi networks"""
     try:
         networks = wifi_service.scan_networks()
-        return jsonify({
-            'status': 'ok',
-            'data': networks
-        })
+        return ok([net.to_dict() for net in networks])
     except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        return err(str(e), 500)
+
+
+
+def _invalidate_wifi_cache():
+    """Drop cached WiFi views after a state change so the UI sees it immediately"""
+    cache.delete('view//api/wifi/status')
+    cache.delete('view//api/wifi/saved')
+    cache.delete('view//api/wifi/scan')
 
 
 @app.route('/api/wifi/connect', methods=['POST'])
@@ -227,29 +511,18 @@ def connect_wifi():
         password = data.get('password')
         
         if not ssid:
-            return jsonify({
-                'status': 'error',
-                'message': 'SSID is required'
-            }), 400
+            return err('SSID is required', 400)
         
         result = wifi_service.connect(ssid, password)
+        _invalidate_wifi_cache()
         
         if result.get('success'):
-            return jsonify({
-                'status': 'ok',
-                'data': result
-            })
+            return ok(result)
         else:
-            return jsonify({
-                'status': 'error',
-                'message': result.get('error', 'Connection failed')
-            }), 500
+            return err(result.get('error', 'Connection failed'), 500)
             
     except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        return err(str(e), 500)
 
 
 @app.route('/api/wifi/disconnect', methods=['POST'])
@@ -257,15 +530,13 @@ def disconnect_wifi():
     """Disconnect from current WiFi network"""
     try:
         result = wifi_service.disconnect()
-        return jsonify({
+        _invalidate_wifi_cache()
+        return ojson({
             'status': 'ok' if result.get('success') else 'error',
             'data': result
         })
     except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        return err(str(e), 500)
 
 
 @app.route('/api/wifi/forget', methods=['POST'])
@@ -276,110 +547,136 @@ def forget_wifi_network():
         ssid = data.get('ssid')
         
         if not ssid:
-            return jsonify({
-                'status': 'error',
-                'message': 'SSID is required'
-            }), 400
+            return err('SSID is required', 400)
         
         result = wifi_service.forget_network(ssid)
-        return jsonify({
+        _invalidate_wifi_cache()
+        return ojson({
             'status': 'ok' if result.get('success') else 'error',
             'data': result
         })
     except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        return err(str(e), 500)
 
 
 @app.route('/api/wifi/saved')
+@cache.cached(timeout=30, response_filter=_only_ok)
 def get_saved_networks():
     """Get list of saved WiFi networks"""
     try:
         networks = wifi_service.get_saved_networks()
-        return jsonify({
-            'status': 'ok',
-            'data': networks
-        })
+        return ok(networks)
     except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        return err(str(e), 500)
 
 
 # ============================================================================
 # System API Endpoints
 # ============================================================================
 
+
+
+# CPU temperature comes from sysfs - forking vcgencmd per request cost tens
+# of ms on the Pi. Refresh at most every 5 seconds.
+_THERMAL_PATH = '/sys/class/thermal/thermal_zone0/temp'
+_cpu_temp_cache = [0.0, 'N/A']
+
+
+def _read_cpu_temp():
+    """CPU temperature string, cached for ~5 seconds"""
+    now = time.monotonic()
+    if now - _cpu_temp_cache[0] > 5.0:
+        try:
+            with open(_THERMAL_PATH) as f:
+                _cpu_temp_cache[1] = f"{int(f.read()) / 1000:.1f}°C"
+        except (OSError, ValueError):
+            _cpu_temp_cache[1] = 'N/A'
+        _cpu_temp_cache[0] = now
+    return _cpu_temp_cache[1]
+
+
+# Platform identity never changes within a process - read it once
+_PLATFORM_INFO = {
+    'platform': platform.system(),
+    'hostname': platform.node(),
+    'architecture': platform.machine(),
+}
+
+# Cached procfs file descriptors - pread() at offset 0 returns fresh contents
+# on every call, so we avoid re-opening and re-splitting whole files per poll
+try:
+    _UPTIME_FD = os.open('/proc/uptime', os.O_RDONLY)
+    _MEMINFO_FD = os.open('/proc/meminfo', os.O_RDONLY)
+except OSError:
+    _UPTIME_FD = None
+    _MEMINFO_FD = None
+
+
+def _read_uptime_seconds():
+    """Read system uptime with a single pread of the cached fd"""
+    buf = os.pread(_UPTIME_FD, 64, 0)
+    return float(buf[:buf.index(b' ')])
+
+
+def _read_meminfo_kb():
+    """Parse MemTotal/MemFree/MemAvailable (kB) from the first three lines"""
+    buf = os.pread(_MEMINFO_FD, 2048, 0)
+    values = []
+    pos = 0
+    for _ in range(3):
+        end = buf.index(b'\n', pos)
+        values.append(int(buf[buf.index(b':', pos) + 1:end].split()[0]))
+        pos = end + 1
+    return values
+
+
 @app.route('/api/system/info')
+@cache.cached(timeout=10, response_filter=_only_ok)
+@singleflight
 def get_system_info():
     """Get system information"""
     try:
-        info = {
-            'platform': platform.system(),
-            'hostname': platform.node(),
-            'architecture': platform.machine(),
-        }
+        info = dict(_PLATFORM_INFO)
         
         # Get uptime on Linux
         try:
-            with open('/proc/uptime', 'r') as f:
-                uptime_seconds = float(f.readline().split()[0])
-                info['uptime_seconds'] = uptime_seconds
-                
-                days = int(uptime_seconds // 86400)
-                hours = int((uptime_seconds % 86400) // 3600)
-                minutes = int((uptime_seconds % 3600) // 60)
-                
-                if days > 0:
-                    info['uptime'] = f"{days}d {hours}h {minutes}m"
-                else:
-                    info['uptime'] = f"{hours}h {minutes}m"
+            uptime_seconds = _read_uptime_seconds()
+            info['uptime_seconds'] = uptime_seconds
+
+            days = int(uptime_seconds // 86400)
+            hours = int((uptime_seconds % 86400) // 3600)
+            minutes = int((uptime_seconds % 3600) // 60)
+
+            if days > 0:
+                info['uptime'] = f"{days}d {hours}h {minutes}m"
+            else:
+                info['uptime'] = f"{hours}h {minutes}m"
         except:
             info['uptime'] = 'N/A'
         
         # Get CPU temperature on Raspberry Pi
-        try:
-            result = subprocess.run(
-                ['vcgencmd', 'measure_temp'],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                temp = result.stdout.strip().replace('temp=', '').replace("'C", '')
-                info['cpu_temp'] = f"{temp}°C"
-        except:
-            info['cpu_temp'] = 'N/A'
+        info['cpu_temp'] = _read_cpu_temp()
         
         # Get memory usage
         try:
-            with open('/proc/meminfo', 'r') as f:
-                lines = f.readlines()
-                mem_total = int(lines[0].split()[1]) // 1024
-                mem_free = int(lines[1].split()[1]) // 1024
-                mem_available = int(lines[2].split()[1]) // 1024
-                mem_used = mem_total - mem_available
-                
-                info['memory'] = {
-                    'total_mb': mem_total,
-                    'used_mb': mem_used,
-                    'free_mb': mem_available,
-                    'percent': round((mem_used / mem_total) * 100, 1)
-                }
+            total_kb, free_kb, available_kb = _read_meminfo_kb()
+            mem_total = total_kb // 1024
+            mem_available = available_kb // 1024
+            mem_used = mem_total - mem_available
+
+            info['memory'] = {
+                'total_mb': mem_total,
+                'used_mb': mem_used,
+                'free_mb': mem_available,
+                'percent': round((mem_used / mem_total) * 100, 1)
+            }
         except:
             info['memory'] = None
         
-        return jsonify({
-            'status': 'ok',
-            'data': info
-        })
+        return ok(info)
         
     except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        return err(str(e), 500)
 
 
 @app.route('/api/system/reboot', methods=['POST'])
@@ -387,15 +684,12 @@ def reboot_system():
     """Reboot the system"""
     try:
         subprocess.Popen(['sudo', 'reboot'], start_new_session=True)
-        return jsonify({
+        return ojson({
             'status': 'ok',
             'message': 'Rebooting...'
         })
     except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        return err(str(e), 500)
 
 
 @app.route('/api/system/shutdown', methods=['POST'])
@@ -403,38 +697,48 @@ def shutdown_system():
     """Shutdown the system"""
     try:
         subprocess.Popen(['sudo', 'shutdown', '-h', 'now'], start_new_session=True)
-        return jsonify({
+        return ojson({
             'status': 'ok',
             'message': 'Shutting down...'
         })
     except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e)
-        }), 500
+        return err(str(e), 500)
     
+# Remember the on-screen keyboard process so hiding it is a direct signal
+# instead of a pkill fork (forking is 50-150 ms on a Pi with Flask loaded)
+_onboard_proc = None
+
+
 @app.route('/api/keyboard/show', methods=['POST'])
 def show_keyboard():
     """Show on-screen keyboard"""
+    global _onboard_proc
     try:
-        subprocess.Popen(
+        # No preexec_fn/start_new_session keeps this eligible for the cheap
+        # posix_spawn path instead of a full fork of the server process
+        _onboard_proc = subprocess.Popen(
             ['/usr/bin/onboard'],
-            env={**os.environ, 'DISPLAY': ':0'},
-            start_new_session=True
+            env={**os.environ, 'DISPLAY': ':0'}
         )
-        return jsonify({'status': 'ok'})
+        return ojson({'status': 'ok'})
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        return err(str(e), 500)
 
 
 @app.route('/api/keyboard/hide', methods=['POST'])
 def hide_keyboard():
     """Hide on-screen keyboard"""
+    global _onboard_proc
     try:
-        subprocess.run(['/usr/bin/pkill', 'onboard'], timeout=5)
-        return jsonify({'status': 'ok'})
+        if _onboard_proc is not None and _onboard_proc.poll() is None:
+            _onboard_proc.send_signal(signal.SIGTERM)
+            _onboard_proc = None
+        else:
+            # Keyboard was started outside this process - fall back to pkill
+            subprocess.run(['/usr/bin/pkill', 'onboard'], timeout=5)
+        return ojson({'status': 'ok'})
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+        return err(str(e), 500)
 
 
 @app.route('/<path:path>')
@@ -443,12 +747,51 @@ def serve_static(path):
     return send_from_directory('../frontend', path)
 
 
+# ============================================================================
+# Hot-path WSGI shim
+# ============================================================================
+# /api/health and /api/config are polled constantly and their bodies are
+# prebaked bytes, so answer them at the WSGI layer and skip Werkzeug routing
+# and request-context setup entirely. Everything else falls through to Flask.
+
+_HOT_PATHS = {
+    '/api/health': _health_body,
+    '/api/config': lambda: _CONFIG_BODY,
+}
+
+
+class _HotPathShim:
+    """Direct dict dispatch for prebaked GET endpoints"""
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        if environ.get('REQUEST_METHOD') == 'GET':
+            handler = _HOT_PATHS.get(environ.get('PATH_INFO'))
+            if handler is not None:
+                body = handler()
+                start_response('200 OK', [
+                    ('Content-Type', 'application/json'),
+                    ('Content-Length', str(len(body))),
+                    ('Access-Control-Allow-Origin', '*'),
+                ])
+                return [body]
+        return self.wsgi_app(environ, start_response)
+
+
+app.wsgi_app = _HotPathShim(app.wsgi_app)
+
 if __name__ == '__main__':
+    # Development only - production runs under gunicorn via systemd:
+    #   gunicorn -k gevent -w 2 --worker-connections 100 -b 0.0.0.0:5000 app:app
     print(f"\n🌊 TideWatch Server Starting...")
     print(f"📍 Location: {app.config['LOCATION_NAME']}")
     print(f"🌊 NOAA Station: {app.config['NOAA_PREDICTION_STATION']}")
     print(f"📶 WiFi management enabled")
     print(f"🌐 Access at: http://localhost:5000")
     print(f"💻 Press Ctrl+C to stop\n")
-    
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+
+    app.run(host='0.0.0.0', port=5000,
+            debug=os.environ.get('TIDEWATCH_DEBUG') == '1',
+            use_reloader=False, threaded=True)
\ No newline at end of file
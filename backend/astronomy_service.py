@@ -2,21 +2,79 @@
 Astronomy Service
 Handles astronomical data from US Naval Observatory API
 """
+import bisect
+import json
+from collections import namedtuple
+import logging
+import math
+import os
+import tempfile
+import types
+from functools import lru_cache
 import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter, Retry
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 import pytz
 
+log = logging.getLogger(__name__)
+
+# orjson decodes the USNO payloads a few times faster than stdlib json;
+# fall back transparently when it is not installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Compact record for one principal-phase event; a namedtuple is a fraction
+# of the size of a dict per entry and serializes to JSON as a plain list
+Phase = namedtuple('Phase', 'phase date time')
+
+
+@lru_cache(maxsize=1440)
+def _convert_to_12hr(time_str):
+    """Convert 24-hour time to 12-hour format with AM/PM
+
+    Pure integer arithmetic on the fixed HH:MM layout - no strptime or
+    locale-aware strftime - and there are only 1440 distinct inputs, so
+    repeat conversions are a cache hit.
+    """
+    if not time_str or time_str == '--:--':
+        return time_str
+
+    try:
+        hour = int(time_str[:2])
+        minute = time_str[3:5]
+        suffix = 'PM' if hour >= 12 else 'AM'
+        return f"{((hour + 11) % 12) + 1}:{minute} {suffix}"
+    except (ValueError, IndexError):
+        return time_str
+
 
 class AstronomyService:
     """Fetches and processes astronomical data from USNO API"""
+
+    # Fixed attribute layout: cheaper attribute access and no per-instance
+    # __dict__
+    __slots__ = (
+        'latitude', 'longitude', 'timezone', '_tz', '_tz_offset_cache',
+        'use_usno_phases', 'session', '_executor', '_astro_cache',
+        '_phase_result_cache', 'moon_phases_cache', '_phases_flat',
+        '_phase_dates', '_day_data_cache', '_day_data_lock', 'cached_month',
+        'daily_cache', 'cached_date',
+    )
     
     # Constants
     BASE_URL = "https://aa.usno.navy.mil/api"
     DEFAULT_TIMEZONE = 'America/Los_Angeles'
     
-    # Moon phase emojis
-    MOON_EMOJIS = {
+    # Moon phase emojis (read-only lookup tables are frozen with
+    # MappingProxyType so they cannot be mutated by accident)
+    MOON_EMOJIS = types.MappingProxyType({
         'New Moon': '🌑',
         'First Quarter': '🌓',
         'Full Moon': '🌕',
@@ -25,42 +83,122 @@ class AstronomyService:
         'Waxing Gibbous': '🌔',
         'Waning Gibbous': '🌖',
         'Waning Crescent': '🌘'
-    }
+    })
     
-    # Phase illumination percentages
-    PHASE_ILLUMINATION = {
-        'New Moon': 0,
-        'First Quarter': 50,
-        'Full Moon': 100,
-        'Last Quarter': 50
-    }
-
-    def __init__(self, latitude: float, longitude: float, timezone: str = None):
+
+    # Mean synodic month and a reference new moon (2000-01-06 18:14 UTC)
+    # for the closed-form moon-age computation
+    SYNODIC_MONTH = 29.53058867
+    NEW_MOON_EPOCH = datetime(2000, 1, 6, 18, 14)
+
+    # Maps (recent principal phase, next principal phase) to the
+    # intermediate phase name and emoji
+    TRANSITIONS = types.MappingProxyType({
+        ('New Moon', 'First Quarter'): ('Waxing Crescent', '🌒'),
+        ('First Quarter', 'Full Moon'): ('Waxing Gibbous', '🌔'),
+        ('Full Moon', 'Last Quarter'): ('Waning Gibbous', '🌖'),
+        ('Last Quarter', 'New Moon'): ('Waning Crescent', '🌘'),
+    })
+
+    # Phase-name windows across the synodic cycle (age in days). Boundaries
+    # sit halfway between the principal phases.
+    PHASE_WINDOWS = (
+        (1.84566, 'New Moon'),
+        (5.53699, 'Waxing Crescent'),
+        (9.22831, 'First Quarter'),
+        (12.91963, 'Waxing Gibbous'),
+        (16.61096, 'Full Moon'),
+        (20.30228, 'Waning Gibbous'),
+        (23.99361, 'Last Quarter'),
+        (27.68493, 'Waning Crescent'),
+        (float('inf'), 'New Moon'),
+    )
+
+    def __init__(self, latitude: float, longitude: float, timezone: str = None,
+                 session=None, use_usno_phases=False):
         self.latitude = latitude
         self.longitude = longitude
         self.timezone = timezone or self.DEFAULT_TIMEZONE
+        self._tz = pytz.timezone(self.timezone)
+        self._tz_offset_cache = (None, None)
+
+        # Moon phase is computed in closed form by default; the USNO phase
+        # table remains available as a verification fallback
+        self.use_usno_phases = use_usno_phases
+
+        # Reuse one pooled session so repeat USNO calls skip the TLS handshake
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(total=2, backoff_factor=0.2,
+                                  status_forcelist=[429, 500, 502, 503, 504])
+            ))
+            session.headers['User-Agent'] = 'TideWatch/1.0'
+        self.session = session
         
+        # The speculative day fetches and the moon-phase path share this pool
+        self._executor = ThreadPoolExecutor(max_workers=4)
+
         # Caching
+        self._astro_cache = (None, None)
+        self._phase_result_cache = (None, None)
         self.moon_phases_cache = {}
+        # Flat date-sorted view of every cached phase, for binary search
+        self._phases_flat = []
+        self._phase_dates = []
+        self._day_data_cache = self._load_day_data()
+        # The speculative day fetches insert into and prune this dict from
+        # several pool threads at once; serialize those mutations
+        self._day_data_lock = threading.Lock()
         self.cached_month = None
         self.daily_cache = None
         self.cached_date = None
 
+        # Warm the phase table off the critical path so the first refresh
+        # of a month never pays the USNO round trip synchronously
+        if self.use_usno_phases:
+            threading.Thread(target=self._fetch_moon_phases,
+                             args=(datetime.now().year,), daemon=True).start()
+
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+
     def _get_timezone_offset(self) -> int:
-        """Get current timezone offset accounting for DST"""
-        tz = pytz.timezone('America/Los_Angeles')
-        now = datetime.now(tz)
-        offset_seconds = now.utcoffset().total_seconds()
-        return int(offset_seconds / 3600)
+        """Get current timezone offset accounting for DST
+
+        Cached per UTC hour - DST shifts at most twice a year, so this
+        avoids a pytz transition lookup on every refresh. Also fixes the
+        old hardcoded America/Los_Angeles to honor self.timezone.
+        """
+        hour_key = int(time.time() // 3600)
+        if self._tz_offset_cache[0] != hour_key:
+            offset_seconds = datetime.now(self._tz).utcoffset().total_seconds()
+            self._tz_offset_cache = (hour_key, int(offset_seconds / 3600))
+        return self._tz_offset_cache[1]
 
     def get_astronomy_data(self) -> Optional[Dict]:
         """Get complete astronomy data (sun/moon rise/set + moon phase)"""
+        # Rise/set times change daily and the moon phase drifts ~0.06%/hour,
+        # so the assembled dict is valid for the whole (date, hour) bucket -
+        # polls within it skip dict construction and formatting entirely
+        now = datetime.now()
+        cache_key = (now.date(), now.hour)
+        if self._astro_cache[0] == cache_key:
+            return self._astro_cache[1]
+
         try:
+            # Moon phase runs concurrently with the rise/set fetches; on the
+            # USNO path both sides hit the network, so overlapping them keeps
+            # wall-clock near a single round trip
+            moon_phase_future = self._executor.submit(self._get_moon_phase)
             rise_set_data = self._get_rise_set_times()
-            moon_phase_data = self._get_moon_phase()
+            moon_phase_data = moon_phase_future.result()
             
             if not rise_set_data:
-                print("Failed to get rise/set data")
+                log.warning("Failed to get rise/set data")
                 return None
             
             astronomy_data = {
@@ -83,13 +221,15 @@ class AstronomyService:
                 'date': rise_set_data.get('date')
             }
             
-            print(f"Astronomy updated: Sunrise {astronomy_data['sunrise']}, "
-                  f"Sunset {astronomy_data['sunset']}, Moon {astronomy_data['moon_phase']}")
+            log.debug("Astronomy updated: Sunrise %s, Sunset %s, Moon %s",
+                      astronomy_data['sunrise'], astronomy_data['sunset'],
+                      astronomy_data['moon_phase'])
             
+            self._astro_cache = (cache_key, astronomy_data)
             return astronomy_data
-            
+
         except Exception as e:
-            print(f"Error getting astronomy data: {e}")
+            log.warning("Error getting astronomy data: %s", e)
             return None
 
     def _get_rise_set_times(self) -> Optional[Dict]:
@@ -99,30 +239,37 @@ class AstronomyService:
             
             # Check cache
             if self.cached_date == today and self.daily_cache:
-                print("Using cached rise/set data")
+                log.debug("Using cached rise/set data")
                 return self.daily_cache
             
             tz_offset = self._get_timezone_offset()
-            
-            # Fetch today's data
-            today_data = self._fetch_day_data(today, tz_offset)
+
+            # Speculatively fetch today, yesterday and tomorrow in parallel.
+            # The extra two are only consulted when today is missing a
+            # moonrise/moonset, but firing them up front hides their round
+            # trips behind today's, so worst case stays ~1 RTT.
+            f_today = self._executor.submit(self._fetch_day_data, today, tz_offset)
+            f_yesterday = self._executor.submit(
+                self._fetch_day_data, today - timedelta(days=1), tz_offset)
+            f_tomorrow = self._executor.submit(
+                self._fetch_day_data, today + timedelta(days=1), tz_offset)
+
+            today_data = f_today.result()
             if not today_data:
                 return None
-            
+
             moonrise = today_data.get('moonrise')
             moonset = today_data.get('moonset')
-            
+
             # If no moonrise today, check yesterday
             if not moonrise:
-                yesterday = today - timedelta(days=1)
-                yesterday_data = self._fetch_day_data(yesterday, tz_offset)
+                yesterday_data = f_yesterday.result()
                 if yesterday_data and yesterday_data.get('moonrise'):
                     moonrise = f"-1 {yesterday_data['moonrise']}"
-            
+
             # If no moonset today, check tomorrow
             if not moonset:
-                tomorrow = today + timedelta(days=1)
-                tomorrow_data = self._fetch_day_data(tomorrow, tz_offset)
+                tomorrow_data = f_tomorrow.result()
                 if tomorrow_data and tomorrow_data.get('moonset'):
                     moonset = f"+1 {tomorrow_data['moonset']}"
             
@@ -142,14 +289,51 @@ class AstronomyService:
             
             return rise_set_data
             
-        except Exception as e:
-            print(f"Error fetching rise/set times: {e}")
-            import traceback
-            traceback.print_exc()
+        except (requests.RequestException, KeyError, ValueError) as e:
+            log.warning("Error fetching rise/set times: %s", e)
+            # exc_info defers traceback formatting to the handler
+            log.debug("rise/set fetch failed", exc_info=True)
             return None
     
+    def _day_data_path(self) -> str:
+        """On-disk location of the persisted per-day rise/set results"""
+        return os.path.join(tempfile.gettempdir(), 'tidewatch_rstt.json')
+
+    def _load_day_data(self) -> Dict:
+        """Load per-day rise/set results persisted by a previous run"""
+        try:
+            with open(self._day_data_path()) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_day_data(self):
+        """Persist the per-day results, dropping entries older than 30 days
+
+        Caller must hold _day_data_lock: the prune rebinds the dict while
+        other pool threads may be inserting.
+        """
+        try:
+            cutoff = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+            self._day_data_cache = {k: v for k, v in self._day_data_cache.items()
+                                    if k[:10] >= cutoff}
+            with open(self._day_data_path(), 'w') as f:
+                json.dump(self._day_data_cache, f)
+        except OSError as e:
+            log.warning("Error persisting rise/set data: %s", e)
+
     def _fetch_day_data(self, date, tz_offset) -> Optional[Dict]:
-        """Fetch rise/set data for a specific day"""
+        """Fetch rise/set data for a specific day
+
+        Rise/set times for a (date, tz) pair never change, so results are
+        memoized to disk and repeat queries - including across process
+        restarts - skip the USNO round trip entirely.
+        """
+        cache_key = f"{date.year}-{date.month:02d}-{date.day:02d}:{tz_offset}"
+        cached = self._day_data_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             url = f"{self.BASE_URL}/rstt/oneday"
             params = {
@@ -158,145 +342,202 @@ class AstronomyService:
                 'tz': str(tz_offset)
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
             
             if 'properties' not in data:
                 return None
             
             props = data['properties']['data']
             
-            # Extract sun times
-            sun_data = props.get('sundata', [])
-            sunrise = self._find_phenomenon(sun_data, 'Rise')
-            sunset = self._find_phenomenon(sun_data, 'Set')
-            solar_noon = self._find_phenomenon(sun_data, 'Upper Transit')
-            
-            # Extract moon times
-            moon_data = props.get('moondata', [])
-            moonrise = self._find_phenomenon(moon_data, 'Rise')
-            moonset = self._find_phenomenon(moon_data, 'Set')
+            # Index phenomena by name once instead of scanning the lists
+            # for each lookup
+            sun_times = self._phenomena_by_name(props.get('sundata', []))
+            sunrise = sun_times.get('Rise')
+            sunset = sun_times.get('Set')
+            solar_noon = sun_times.get('Upper Transit')
+
+            moon_times = self._phenomena_by_name(props.get('moondata', []))
+            moonrise = moon_times.get('Rise')
+            moonset = moon_times.get('Set')
             
             # Convert all times to 12-hour format
-            return {
+            result = {
                 'sunrise': self._convert_to_12hr(sunrise),
                 'sunset': self._convert_to_12hr(sunset),
                 'solar_noon': self._convert_to_12hr(solar_noon),
                 'moonrise': self._convert_to_12hr(moonrise),
                 'moonset': self._convert_to_12hr(moonset)
             }
-            
-        except Exception as e:
-            print(f"Error fetching data for {date}: {e}")
+
+            with self._day_data_lock:
+                self._day_data_cache[cache_key] = result
+                self._save_day_data()
+            return result
+
+        except (requests.RequestException, KeyError, ValueError) as e:
+            log.warning("Error fetching data for %s: %s", date, e)
             return None
 
-    def _find_phenomenon(self, data_list: List, phenomenon: str) -> Optional[str]:
-        """Find a specific phenomenon (Rise, Set, etc.) in the data"""
-        for item in data_list:
-            if item.get('phen') == phenomenon:
-                return item.get('time', '--:--')
-        return None
+    def _phenomena_by_name(self, data_list: List) -> Dict:
+        """Build a {phenomenon: time} map from USNO sundata/moondata lists"""
+        return {item.get('phen'): item.get('time', '--:--') for item in data_list}
     
     def _convert_to_12hr(self, time_str: Optional[str]) -> Optional[str]:
         """Convert 24-hour time to 12-hour format with AM/PM"""
-        if not time_str or time_str == '--:--':
-            return time_str
-        
-        try:
-            time_obj = datetime.strptime(time_str, '%H:%M')
-            return time_obj.strftime('%I:%M %p').lstrip('0')
-        except:
-            return time_str
+        return _convert_to_12hr(time_str)
+
+    def _moon_age(self, dt: datetime) -> float:
+        """Days since the last mean new moon (0 <= age < SYNODIC_MONTH)"""
+        elapsed = (dt - self.NEW_MOON_EPOCH).total_seconds() / 86400.0
+        return elapsed % self.SYNODIC_MONTH
+
+    def _compute_moon_phase(self, dt: datetime) -> Dict:
+        """Closed-form moon phase - pure arithmetic, no network
+
+        Accurate to ~half a day, which is plenty for labeling the phase
+        and estimating illumination on the display.
+        """
+        age = self._moon_age(dt)
+
+        for boundary, name in self.PHASE_WINDOWS:
+            if age < boundary:
+                phase_name = name
+                break
+
+        # True illumination follows the synodic cosine curve
+        illumination = int(round(
+            50 * (1 - math.cos(2 * math.pi * age / self.SYNODIC_MONTH))
+        ))
+
+        return {
+            'phase_name': phase_name,
+            'illumination': illumination,
+            'emoji': self.MOON_EMOJIS.get(phase_name, '\U0001f319'),
+            'moon_age_days': round(age, 1)
+        }
 
     def _get_moon_phase(self) -> Dict:
         """Get current moon phase data"""
+        if not self.use_usno_phases:
+            return self._compute_moon_phase(datetime.now())
+
         try:
             today = datetime.now()
-            current_month = today.strftime('%Y-%m')
+            # f-string from integer fields avoids strftime's locale machinery
+            current_month = f"{today.year}-{today.month:02d}"
             
-            # Check if we need to fetch moon phases
+            # The table is prefetched at startup; this only fires at year
+            # rollover or if the prefetch failed
             if current_month != self.cached_month or current_month not in self.moon_phases_cache:
                 self._fetch_moon_phases(today.year)
             
             return self._calculate_current_phase(today)
             
         except Exception as e:
-            print(f"Error getting moon phase: {e}")
+            log.warning("Error getting moon phase: %s", e)
             return {
                 'phase_name': 'Unknown',
                 'illumination': 50,
                 'emoji': '🌔'
             }
 
+    def _moon_phases_path(self, year: int) -> str:
+        """On-disk location of the persisted phase table for a year"""
+        return os.path.join(tempfile.gettempdir(), f'tidewatch_moon_{year}.json')
+
+    def _load_moon_phases(self, year: int) -> bool:
+        """Load a previously persisted phase table, if one exists"""
+        try:
+            with open(self._moon_phases_path(year)) as f:
+                loaded = json.load(f)
+            for month_key, entries in loaded.items():
+                self.moon_phases_cache[month_key] = [Phase(*e) for e in entries]
+            self._rebuild_phase_index()
+            self.cached_month = datetime.now().strftime('%Y-%m')
+            return True
+        except (OSError, TypeError, ValueError):
+            return False
+
+    def _save_moon_phases(self, year: int):
+        """Persist the phase table so restarts skip the USNO fetch"""
+        try:
+            year_months = {k: v for k, v in self.moon_phases_cache.items()
+                           if k.startswith(str(year))}
+            with open(self._moon_phases_path(year), 'w') as f:
+                json.dump(year_months, f)
+        except OSError as e:
+            log.warning("Error persisting moon phases: %s", e)
+
     def _fetch_moon_phases(self, year: int):
         """Fetch and cache moon phases for the entire year"""
+        # Phase dates are fixed for the year, so a table persisted by a
+        # previous run is just as good as a fresh fetch
+        if self._load_moon_phases(year):
+            return
+
         try:
             tz_offset = self._get_timezone_offset()
-            
+
             url = f"{self.BASE_URL}/moon/phases/year"
             params = {
                 'year': year,
                 'tz': str(tz_offset)
             }
-            
-            print(f"Fetching moon phases for {year} (TZ offset: {tz_offset})")
-            response = requests.get(url, params=params, timeout=10)
+
+            log.debug("Fetching moon phases for %s (TZ offset: %s)", year, tz_offset)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
-            
+            data = _loads(response.content)
+
             if 'phasedata' in data:
-                # Store phases by month
-                for phase in data['phasedata']:
-                    month = phase['month']
-                    month_key = f"{year}-{month:02d}"
-                    
-                    if month_key not in self.moon_phases_cache:
-                        self.moon_phases_cache[month_key] = []
-                    
-                    self.moon_phases_cache[month_key].append({
-                        'phase': phase['phase'],
-                        'date': f"{year}-{month:02d}-{phase['day']:02d}",
-                        'time': phase['time']
-                    })
+                # Store phases by month in a single pass
+                for p in data['phasedata']:
+                    month_key = f"{year}-{p['month']:02d}"
+                    self.moon_phases_cache.setdefault(month_key, []).append(
+                        Phase(p['phase'],
+                              f"{year}-{p['month']:02d}-{p['day']:02d}",
+                              p['time']))
                 
+                self._rebuild_phase_index()
                 self.cached_month = datetime.now().strftime('%Y-%m')
-                print(f"Cached moon phases for {year}")
+                self._save_moon_phases(year)
+                log.debug("Cached moon phases for %s", year)
             
-        except Exception as e:
-            print(f"Error fetching moon phases: {e}")
+        except (requests.RequestException, KeyError, ValueError) as e:
+            log.warning("Error fetching moon phases: %s", e)
+
+    def _rebuild_phase_index(self):
+        """Rebuild the flat sorted phase list after the cache changes"""
+        self._phases_flat = sorted(
+            (p for entries in self.moon_phases_cache.values() for p in entries),
+            key=lambda p: p.date)
+        self._phase_dates = [p.date for p in self._phases_flat]
 
     def _calculate_current_phase(self, current_date: datetime) -> Dict:
         """Calculate current moon phase based on cached phase data"""
-        current_month = current_date.strftime('%Y-%m')
-        phases = self.moon_phases_cache.get(current_month, [])
-        
-        if not phases:
+        # The result only changes when the date does, so the bisect and
+        # interpolation run at most once per day
+        current_date_str = (f"{current_date.year}-{current_date.month:02d}-"
+                            f"{current_date.day:02d}")
+        if self._phase_result_cache[0] == current_date_str:
+            return self._phase_result_cache[1]
+
+        if not self._phase_dates:
             return {
                 'phase_name': 'Unknown',
                 'illumination': 50,
                 'emoji': '🌔'
             }
-        
-        # Find the most recent phase and next phase
-        current_date_str = current_date.strftime('%Y-%m-%d')
-        recent_phase = None
-        next_phase = None
-        
-        for phase in phases:
-            if phase['date'] <= current_date_str:
-                recent_phase = phase
-            elif phase['date'] > current_date_str and not next_phase:
-                next_phase = phase
-                break
-        
-        # If no recent phase in this month, check previous month
-        if not recent_phase:
-            prev_month = (current_date.replace(day=1) - timedelta(days=1))
-            prev_month_key = prev_month.strftime('%Y-%m')
-            prev_phases = self.moon_phases_cache.get(prev_month_key, [])
-            if prev_phases:
-                recent_phase = prev_phases[-1]
+
+        # One binary search over the flat date-sorted list finds both
+        # bracketing phases; no month-key juggling or previous-month
+        # fallback needed
+        idx = bisect.bisect_right(self._phase_dates, current_date_str)
+        recent_phase = self._phases_flat[idx - 1] if idx > 0 else None
+        next_phase = (self._phases_flat[idx]
+                      if idx < len(self._phases_flat) else None)
         
         # Determine current phase
         if recent_phase:
@@ -304,14 +545,18 @@ class AstronomyService:
                 recent_phase, next_phase, current_date
             )
             
-            return {
+            result = {
                 'phase_name': phase_name,
                 'illumination': illumination,
                 'emoji': emoji,
-                'last_phase_date': recent_phase['date'],
-                'next_phase': next_phase['phase'] if next_phase else None,
-                'next_phase_date': next_phase['date'] if next_phase else None
+                'last_phase_date': recent_phase.date,
+                'next_phase': next_phase.phase if next_phase else None,
+                'next_phase_date': next_phase.date if next_phase else None
             }
+            # Only successful computations are memoized; Unknown fallbacks
+            # should retry once the table has been fetched
+            self._phase_result_cache = (current_date_str, result)
+            return result
         
         return {
             'phase_name': 'Unknown',
@@ -319,47 +564,30 @@ class AstronomyService:
             'emoji': '🌔'
         }
 
-    def _get_detailed_phase(self, recent_phase: Dict, next_phase: Optional[Dict], 
+    def _get_detailed_phase(self, recent_phase: Phase, next_phase: Optional[Phase], 
                            current_date: datetime) -> tuple:
         """Get detailed phase name, emoji, and illumination"""
-        recent_name = recent_phase['phase']
-        
+        recent_name = recent_phase.phase
+
+        # Illumination follows the true synodic cosine curve; the old
+        # linear ramps between quarters drifted several percent mid-phase
+        age = self._moon_age(current_date)
+        illumination = int(round(
+            50 * (1 - math.cos(2 * math.pi * age / self.SYNODIC_MONTH))
+        ))
+
         if not next_phase:
-            emoji = self.MOON_EMOJIS.get(recent_name, '🌙')
-            illumination = self.PHASE_ILLUMINATION.get(recent_name, 50)
-            return (recent_name, emoji, illumination)
-        
-        # Calculate days since recent phase
-        recent_date = datetime.strptime(recent_phase['date'], '%Y-%m-%d')
-        next_date = datetime.strptime(next_phase['date'], '%Y-%m-%d')
-        total_days = (next_date - recent_date).days
-        days_since = (current_date.date() - recent_date.date()).days
-        
-        progress = days_since / total_days if total_days > 0 else 0
-        
-        # Determine intermediate phase
-        phase_name = recent_name
-        
-        if recent_name == 'New Moon' and next_phase['phase'] == 'First Quarter':
-            phase_name = 'Waxing Crescent'
-            emoji = '🌒'
-            illumination = int(progress * 50)
-        elif recent_name == 'First Quarter' and next_phase['phase'] == 'Full Moon':
-            phase_name = 'Waxing Gibbous'
-            emoji = '🌔'
-            illumination = 50 + int(progress * 50)
-        elif recent_name == 'Full Moon' and next_phase['phase'] == 'Last Quarter':
-            phase_name = 'Waning Gibbous'
-            emoji = '🌖'
-            illumination = 100 - int(progress * 50)
-        elif recent_name == 'Last Quarter' and next_phase['phase'] == 'New Moon':
-            phase_name = 'Waning Crescent'
-            emoji = '🌘'
-            illumination = 50 - int(progress * 50)
+            return (recent_name, self.MOON_EMOJIS.get(recent_name, '🌙'),
+                    illumination)
+
+        # Phase name still comes from the table
+        transition = self.TRANSITIONS.get((recent_name, next_phase.phase))
+        if transition:
+            phase_name, emoji = transition
         else:
+            phase_name = recent_name
             emoji = self.MOON_EMOJIS.get(recent_name, '🌙')
-            illumination = self.PHASE_ILLUMINATION.get(recent_name, 50)
-        
+
         return (phase_name, emoji, illumination)
 
 
@@ -16,7 +16,8 @@ class Config:
     
     # Flask Configuration
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-key-change-in-production'
-    DEBUG = True
+    DEBUG = os.environ.get('TIDEWATCH_DEBUG') == '1'
+    SEND_FILE_MAX_AGE_DEFAULT = 3600   # Let the kiosk browser cache static assets
     
     # Data Refresh Intervals (in seconds)
     TIDE_REFRESH_INTERVAL = 360        # 6 minutes (NOAA updates every 6 min)
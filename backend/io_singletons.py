@@ -0,0 +1,26 @@
+"""
+Shared I/O singletons
+One pooled HTTP session and one thread pool for the whole backend, so
+every service amortizes the same keep-alive connections and worker
+threads instead of growing its own.
+"""
+import atexit
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter, Retry
+
+# One pooled HTTP session shared by every service - keep-alive amortizes
+# the TLS handshakes that cost 100-300 ms per upstream call on the Pi
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+SESSION.headers['User-Agent'] = 'TideWatch/1.0'
+
+# Shared pool for overlapping independent upstream fetches
+IO_POOL = ThreadPoolExecutor(max_workers=4)
+
+atexit.register(SESSION.close)
+atexit.register(IO_POOL.shutdown, wait=False)
@@ -2,9 +2,24 @@
 Tide Service
 Handles tide data from NOAA CO-OPS API
 """
+import bisect
 import requests
+import time
+from requests.adapters import HTTPAdapter, Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import pytz
+from zoneinfo import ZoneInfo
+
+UTC = ZoneInfo('UTC')
+
+# orjson decodes the NOAA payloads a few times faster than stdlib json;
+# fall back transparently when it is not installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
 
 
 class TideService:
@@ -17,8 +32,8 @@ class TideService:
     UNITS = "english"
     APPLICATION_NAME = "TideWatch"
     
-    def __init__(self, prediction_station=None, observation_station=None, 
-                 timezone="America/Los_Angeles"):
+    def __init__(self, prediction_station=None, observation_station=None,
+                 timezone="America/Los_Angeles", session=None):
         """
         Initialize tide service
         Uses Seattle for both predictions and observations as subordinate stations
@@ -26,28 +41,62 @@ class TideService:
         """
         self.prediction_station = prediction_station or self.DEFAULT_STATION
         self.observation_station = observation_station or self.DEFAULT_STATION
-        self.timezone = pytz.timezone(timezone)
+        # Reuse one pooled session so repeat NOAA calls skip the TLS
+        # handshake; the app normally injects its shared session here
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(
+                pool_connections=2,
+                pool_maxsize=4,
+                max_retries=Retry(total=2, backoff_factor=0.2,
+                                  status_forcelist=[429, 500, 502, 503, 504])
+            ))
+            session.headers['User-Agent'] = 'TideWatch/1.0'
+        self.session = session
+        # The two independent NOAA fetches run on this pool
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        # zoneinfo is stdlib and C-backed; aware datetimes are built with
+        # tzinfo= directly instead of pytz's per-call localize()
+        self.timezone = ZoneInfo(timezone)
         
         # Caching
         self.cached_predictions = None
         self.cached_current = None
+        self.cached_days = 0
         self.last_prediction_update = None
         self.last_current_update = None
+        # Prediction responses keyed by (station, begin, end, interval);
+        # a 7-day hilo window is deterministic, so repeats within 30
+        # minutes never reach NOAA
+        self._pred_cache = {}
     
     def _convert_to_12hr(self, time_str):
         """Convert 24-hour time string to 12-hour format with AM/PM"""
         try:
             dt = datetime.strptime(time_str, "%Y-%m-%d %H:%M")
-            dt = self.timezone.localize(dt)
+            dt = dt.replace(tzinfo=self.timezone)
             return dt.strftime('%I:%M %p').lstrip('0')
         except:
             return time_str
+
+    def _tide_dt(self, tide):
+        """Aware datetime for a prediction, parsing (and caching) on demand
+
+        Predictions built by get_tide_predictions carry 'dt' already; lists
+        supplied by callers get it filled in on first use.
+        """
+        dt = tide.get('dt')
+        if dt is None:
+            dt = datetime.strptime(
+                tide['time'], "%Y-%m-%d %H:%M").replace(tzinfo=self.timezone)
+            tide['dt'] = dt
+        return dt
     
     def get_current_water_level(self):
         """Get the current water level from observation station"""
         try:
             now = datetime.now(self.timezone)
-            now_gmt = now.astimezone(pytz.UTC)
+            now_gmt = now.astimezone(UTC)
             
             # Get data from last 30 minutes
             begin_date = (now_gmt - timedelta(minutes=30)).strftime("%Y%m%d %H:%M")
@@ -65,9 +114,9 @@ class TideService:
                 'application': self.APPLICATION_NAME
             }
             
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = self.session.get(self.BASE_URL, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
             
             # Get the most recent reading
             if 'data' in data and len(data['data']) > 0:
@@ -75,7 +124,7 @@ class TideService:
                 
                 # Convert GMT time to local Pacific time
                 gmt_time = datetime.strptime(latest['t'], "%Y-%m-%d %H:%M")
-                gmt_time = pytz.UTC.localize(gmt_time)
+                gmt_time = gmt_time.replace(tzinfo=UTC)
                 local_time = gmt_time.astimezone(self.timezone)
                 
                 current_level = {
@@ -103,12 +152,23 @@ class TideService:
     
     def get_tide_predictions(self, days=7):
         """Get tide predictions from prediction station"""
+        # Predictions are a fixed forecast; a recent fetch covering at least
+        # the requested span answers without another NOAA call
+        if (self.cached_predictions and self.cached_days >= days
+                and self.last_prediction_update
+                and (datetime.now() - self.last_prediction_update).total_seconds() < 600):
+            return self.cached_predictions
+
+        now = datetime.now(self.timezone)
+        begin_date = (now - timedelta(days=1)).strftime("%Y%m%d")
+        end_date = (now + timedelta(days=days)).strftime("%Y%m%d")
+
+        cache_key = (self.prediction_station, begin_date, end_date, 'hilo')
+        cached = self._pred_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < 1800:
+            return cached[1]
+
         try:
-            now = datetime.now(self.timezone)
-            
-            begin_date = (now - timedelta(days=1)).strftime("%Y%m%d")
-            end_date = (now + timedelta(days=days)).strftime("%Y%m%d")
-            
             params = {
                 'station': self.prediction_station,
                 'begin_date': begin_date,
@@ -122,27 +182,38 @@ class TideService:
                 'application': self.APPLICATION_NAME
             }
             
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = self.session.get(self.BASE_URL, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
             
             if 'error' in data:
                 print(f"❌ API Error: {data.get('error', {})}")
                 return None
             
             if 'predictions' in data:
-                predictions = [
-                    {
+                # Parse each timestamp exactly once at ingest; the aware
+                # datetime rides along on the dict so downstream loops never
+                # re-run strptime/localize
+                predictions = []
+                for pred in data['predictions']:
+                    dt = datetime.strptime(
+                        pred['t'], "%Y-%m-%d %H:%M").replace(tzinfo=self.timezone)
+                    predictions.append({
                         'time': pred['t'],
-                        'time_12hr': self._convert_to_12hr(pred['t']),
+                        'time_12hr': dt.strftime('%I:%M %p').lstrip('0'),
                         'height': round(float(pred['v']), 2),
-                        'type': pred['type']  # 'H' for high, 'L' for low
-                    }
-                    for pred in data['predictions']
-                ]
+                        'type': pred['type'],  # 'H' for high, 'L' for low
+                        'dt': dt
+                    })
                 
                 self.cached_predictions = predictions
+                self.cached_days = days
                 self.last_prediction_update = datetime.now()
+
+                # Old date-range keys go stale at midnight; keep the map tiny
+                if len(self._pred_cache) >= 8:
+                    self._pred_cache.clear()
+                self._pred_cache[cache_key] = (time.monotonic(), predictions)
                 
                 print(f"✅ Loaded {len(predictions)} tide predictions (from Seattle)")
                 return predictions
@@ -154,37 +225,40 @@ class TideService:
             print(f"❌ Error getting tide predictions: {e}")
             return self.cached_predictions
     
-    def get_next_tides(self):
+    def get_next_tides(self, predictions=None):
         """Get the next high and low tides from current time"""
-        predictions = self.get_tide_predictions(days=2)
+        if predictions is None:
+            predictions = self.get_tide_predictions(days=2)
         if not predictions:
             return None
         
         now = datetime.now(self.timezone)
+
+        # Predictions are time-sorted, so bisect jumps straight past the
+        # tides already behind us
+        dt_list = [self._tide_dt(t) for t in predictions]
+        idx = bisect.bisect_right(dt_list, now)
+
         next_high = None
         next_low = None
-        
-        for tide in predictions:
-            tide_time = datetime.strptime(tide['time'], "%Y-%m-%d %H:%M")
-            tide_time = self.timezone.localize(tide_time)
-            
-            if tide_time > now:
-                if tide['type'] == 'H' and not next_high:
-                    next_high = tide
-                elif tide['type'] == 'L' and not next_low:
-                    next_low = tide
-                
-                if next_high and next_low:
-                    break
+        for tide in predictions[idx:]:
+            if tide['type'] == 'H' and not next_high:
+                next_high = tide
+            elif tide['type'] == 'L' and not next_low:
+                next_low = tide
+
+            if next_high and next_low:
+                break
         
         return {
             'next_high': next_high,
             'next_low': next_low
         }
     
-    def get_todays_tides(self):
+    def get_todays_tides(self, predictions=None):
         """Get all high/low tides for today"""
-        predictions = self.get_tide_predictions(days=1)
+        if predictions is None:
+            predictions = self.get_tide_predictions(days=1)
         if not predictions:
             return None
         
@@ -194,21 +268,22 @@ class TideService:
         
         todays_tides = []
         for tide in predictions:
-            tide_time = datetime.strptime(tide['time'], "%Y-%m-%d %H:%M")
-            tide_time = self.timezone.localize(tide_time)
-            
+            tide_time = self._tide_dt(tide)
+
             if today_start <= tide_time < today_end:
                 todays_tides.append(tide)
         
         return todays_tides
     
-    def calculate_tide_status(self):
+    def calculate_tide_status(self, predictions=None, current=None):
         """
         Calculate if tide is rising or falling, and percentage through cycle
         Returns: dict with 'direction', 'percentage', 'is_rising'
         """
-        predictions = self.get_tide_predictions(days=1)
-        current = self.get_current_water_level()
+        if predictions is None:
+            predictions = self.get_tide_predictions(days=1)
+        if current is None:
+            current = self.get_current_water_level()
         
         if not predictions:
             return {
@@ -219,20 +294,13 @@ class TideService:
             }
         
         now = datetime.now(self.timezone)
-        
-        # Find the tide events before and after current time
-        prev_tide = None
-        next_tide = None
-        
-        for tide in predictions:
-            tide_time = datetime.strptime(tide['time'], "%Y-%m-%d %H:%M")
-            tide_time = self.timezone.localize(tide_time)
-            
-            if tide_time <= now:
-                prev_tide = tide
-            elif tide_time > now and not next_tide:
-                next_tide = tide
-                break
+
+        # Find the tide events bracketing the current time with one
+        # binary search over the sorted list
+        dt_list = [self._tide_dt(t) for t in predictions]
+        idx = bisect.bisect_right(dt_list, now)
+        prev_tide = predictions[idx - 1] if idx > 0 else None
+        next_tide = predictions[idx] if idx < len(predictions) else None
         
         if not prev_tide or not next_tide:
             return {
@@ -246,10 +314,8 @@ class TideService:
         is_rising = next_tide['type'] == 'H'
         
         # Calculate percentage through this tide cycle
-        prev_time = datetime.strptime(prev_tide['time'], "%Y-%m-%d %H:%M")
-        prev_time = self.timezone.localize(prev_time)
-        next_time = datetime.strptime(next_tide['time'], "%Y-%m-%d %H:%M")
-        next_time = self.timezone.localize(next_time)
+        prev_time = self._tide_dt(prev_tide)
+        next_time = self._tide_dt(next_tide)
         
         total_duration = (next_time - prev_time).total_seconds()
         elapsed = (now - prev_time).total_seconds()
@@ -279,11 +345,16 @@ class TideService:
     
     def get_all_tide_data(self):
         """Get everything - current level, predictions, and status"""
-        current = self.get_current_water_level()
+        # Water level and predictions are independent NOAA calls; running
+        # them concurrently makes wall time max(t1, t2) instead of the sum
+        current_future = self._executor.submit(self.get_current_water_level)
         predictions = self.get_tide_predictions(days=7)
-        next_tides = self.get_next_tides()
-        todays_tides = self.get_todays_tides()
-        status = self.calculate_tide_status()
+        current = current_future.result()
+
+        # One prediction list feeds every derived view - no repeat fetches
+        next_tides = self.get_next_tides(predictions)
+        todays_tides = self.get_todays_tides(predictions)
+        status = self.calculate_tide_status(predictions, current)
         
         return {
             'current': current,
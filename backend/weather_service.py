@@ -2,9 +2,22 @@
 Weather Service
 Handles weather data from Weather.gov API
 """
-import requests
+import json
+import os
+import tempfile
+import time
 from datetime import datetime
 
+from io_singletons import SESSION, IO_POOL
+
+# orjson decodes the ~40KB forecast payload a few times faster than
+# stdlib json; fall back transparently when it is not installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 class WeatherService:
     """Fetches and processes weather data from Weather.gov API"""
@@ -14,27 +27,78 @@ class WeatherService:
     DEFAULT_STATION = "KNUW"
     METERS_TO_MILES = 1609.34
     MS_TO_MPH = 2.237
-    CELSIUS_TO_FAHRENHEIT_MULT = 9/5
-    CELSIUS_TO_FAHRENHEIT_ADD = 32
     COMPASS_POINTS = 16
     DEGREES_PER_POINT = 360 / COMPASS_POINTS
+    # Observations update roughly hourly upstream; anything fresher than
+    # this is served straight from cache
+    CACHE_TTL_SECONDS = 300
+    # The NWS grid mapping for a coordinate is stable for years; refresh
+    # the persisted forecast URL this often just in case
+    FORECAST_URL_TTL_DAYS = 30
+    DIRECTIONS = (
+        'N', 'NNE', 'NE', 'ENE',
+        'E', 'ESE', 'SE', 'SSE',
+        'S', 'SSW', 'SW', 'WSW',
+        'W', 'WNW', 'NW', 'NNW'
+    )
 
-    def __init__(self, latitude, longitude):
+    def __init__(self, latitude, longitude, session=None):
         self.latitude = latitude
         self.longitude = longitude
-        self.forecast_url = None
+        # Default to the process-wide pooled session so standalone use
+        # (scripts, __main__) shares keep-alive connections with the app
+        self.session = session if session is not None else SESSION
+        self.forecast_url = self._load_forecast_url()
         self.cached_data = None
         self.last_update = None
+        self._cache_ts = None
+
+    def close(self):
+        """Close the underlying HTTP session (never the shared one)"""
+        if self.session is not SESSION:
+            self.session.close()
+
+    def _forecast_url_path(self) -> str:
+        """On-disk location of the persisted forecast URL"""
+        return os.path.join(tempfile.gettempdir(), 'tidewatch_forecast_url.json')
+
+    def _load_forecast_url(self):
+        """Reuse the forecast URL resolved by a previous run
+
+        Saves the /points round trip on cold start. Entries are keyed by
+        coordinates and expire after FORECAST_URL_TTL_DAYS.
+        """
+        try:
+            with open(self._forecast_url_path()) as f:
+                entry = json.load(f)
+            if (entry.get('coords') == [self.latitude, self.longitude]
+                    and time.time() - entry.get('saved', 0)
+                        < self.FORECAST_URL_TTL_DAYS * 86400):
+                return entry.get('url')
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _save_forecast_url(self):
+        """Persist the resolved forecast URL for future cold starts"""
+        try:
+            with open(self._forecast_url_path(), 'w') as f:
+                json.dump({'coords': [self.latitude, self.longitude],
+                           'url': self.forecast_url,
+                           'saved': time.time()}, f)
+        except OSError as e:
+            print(f"Error persisting forecast URL: {e}")
 
     def _get_forecast_url(self):
         """Get the forecast URL for the location"""
         try:
             points_url = f"{self.BASE_URL}/points/{self.latitude},{self.longitude}"
-            response = requests.get(points_url, timeout=10)
+            response = self.session.get(points_url, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = _loads(response.content)
             self.forecast_url = data['properties']['forecast']
+            self._save_forecast_url()
             
             print(f"Forecast URL: {self.forecast_url}")
             return True
@@ -50,10 +114,10 @@ class WeatherService:
             
         try:
             obs_url = f"{self.BASE_URL}/stations/{station_id}/observations/latest"
-            response = requests.get(obs_url, timeout=10)
+            response = self.session.get(obs_url, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = _loads(response.content)
             props = data['properties']
             
             return {
@@ -78,45 +142,68 @@ class WeatherService:
             
     def get_weather(self):
         """Fetch current weather observations and forecast"""
+        # Hot path: frontend polls far more often than weather.gov updates
+        if (self.cached_data and self._cache_ts is not None
+                and time.monotonic() - self._cache_ts < self.CACHE_TTL_SECONDS):
+            return self.cached_data
+
         try:
-            # Get current observations
-            current = self._get_current_observations()
-            
-            # Get forecast URL if not cached
+            # Observations and forecast are independent weather.gov calls;
+            # overlap them so wall time is max(t1, t2) instead of the sum
+            current_future = IO_POOL.submit(self._get_current_observations)
+
+            # Get forecast URL if not cached (first call only)
             if not self.forecast_url and not self._get_forecast_url():
+                current_future.result()
                 return None
-            
+
             # Get forecast data
-            response = requests.get(self.forecast_url, timeout=10)
+            response = self.session.get(self.forecast_url, timeout=10)
             response.raise_for_status()
+            current = current_future.result()
             
-            data = response.json()
+            data = _loads(response.content)
             periods = data['properties']['periods']
+            p0 = periods[0]
             
+            # Decide the source of current conditions once instead of
+            # re-testing `current` for every key
+            if current:
+                observed = {
+                    'temperature': current['temperature'],
+                    'conditions': (current['conditions']
+                                   if current['conditions'] != 'N/A'
+                                   else p0['shortForecast']),
+                    'wind_speed': current['wind_speed'],
+                    'wind_direction': current['wind_direction'],
+                    'wind_direction_degrees': current['wind_direction_degrees'],
+                    'visibility': current['visibility'],
+                    'humidity': current['humidity'],
+                    'pressure': current['pressure'],
+                    'dewpoint': current['dewpoint'],
+                }
+            else:
+                observed = {
+                    'temperature': p0['temperature'],
+                    'conditions': p0['shortForecast'],
+                    'wind_speed': p0['windSpeed'],
+                    'wind_direction': p0['windDirection'],
+                    'wind_direction_degrees': None,
+                    'visibility': None,
+                    'humidity': None,
+                    'pressure': None,
+                    'dewpoint': None,
+                }
+
             # Build combined weather object
             weather_data = {
-                # Current conditions from observation station
-                'temperature': (current['temperature'] if current 
-                              else periods[0]['temperature']),
+                **observed,
                 'temperature_unit': 'F',
-                'conditions': (current.get('conditions') 
-                             if current and current.get('conditions') != 'N/A'
-                             else periods[0]['shortForecast']),
-                'wind_speed': (current['wind_speed'] if current 
-                             else periods[0]['windSpeed']),
-                'wind_direction': (current['wind_direction'] if current 
-                                 else periods[0]['windDirection']),
-                'wind_direction_degrees': (current['wind_direction_degrees'] 
-                                         if current else None),
-                'visibility': current['visibility'] if current else None,
-                'humidity': current['humidity'] if current else None,
-                'pressure': current['pressure'] if current else None,
-                'dewpoint': current['dewpoint'] if current else None,
                 
                 # Forecast data
-                'detailed_forecast': periods[0]['detailedForecast'],
-                'icon': periods[0]['icon'],
-                'is_daytime': periods[0]['isDaytime'],
+                'detailed_forecast': p0['detailedForecast'],
+                'icon': p0['icon'],
+                'is_daytime': p0['isDaytime'],
                 'forecast_periods': periods[:5],
                 
                 'last_update': datetime.now().isoformat(),
@@ -126,6 +213,7 @@ class WeatherService:
             # Cache the data
             self.cached_data = weather_data
             self.last_update = datetime.now()
+            self._cache_ts = time.monotonic()
             
             print(f"Weather updated: {weather_data['temperature']}°F, "
                   f"{weather_data['conditions']}, Visibility: {weather_data['visibility']}")
@@ -140,22 +228,21 @@ class WeatherService:
     
     def _convert_temp(self, temp_obj):
         """Convert temperature from Celsius to Fahrenheit"""
-        if not temp_obj or temp_obj.get('value') is None:
+        if temp_obj is None:
             return None
-        
-        celsius = temp_obj['value']
-        fahrenheit = (celsius * self.CELSIUS_TO_FAHRENHEIT_MULT 
-                     + self.CELSIUS_TO_FAHRENHEIT_ADD)
-        return round(fahrenheit)
+        celsius = temp_obj.get('value')
+        if celsius is None:
+            return None
+        return round(celsius * 1.8 + 32)
     
     def _format_wind(self, wind_obj):
         """Format wind speed to mph"""
-        if not wind_obj or wind_obj.get('value') is None:
+        if wind_obj is None:
             return 'N/A'
-        
-        meters_per_sec = wind_obj['value']
-        mph = meters_per_sec * self.MS_TO_MPH
-        return f"{round(mph)} mph"
+        meters_per_sec = wind_obj.get('value')
+        if meters_per_sec is None:
+            return 'N/A'
+        return f"{round(meters_per_sec * self.MS_TO_MPH)} mph"
     
     def _format_visibility(self, vis_obj):
         """Format visibility to miles"""
@@ -170,16 +257,10 @@ class WeatherService:
         """Convert wind direction degrees to compass direction"""
         if degrees is None:
             return 'N/A'
-        
-        directions = [
-            'N', 'NNE', 'NE', 'ENE',
-            'E', 'ESE', 'SE', 'SSE',
-            'S', 'SSW', 'SW', 'WSW',
-            'W', 'WNW', 'NW', 'NNW'
-        ]
-        
-        index = round(degrees / self.DEGREES_PER_POINT) % self.COMPASS_POINTS
-        return directions[index]
+
+        # Offset by half a sector and floor-divide; equivalent to the old
+        # round() but without rebuilding the table per call
+        return self.DIRECTIONS[int((degrees + 11.25) // 22.5) % 16]
 
 
 if __name__ == "__main__":
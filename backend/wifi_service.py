@@ -3,10 +3,34 @@ WiFi Service for TideWatch
 Handles WiFi scanning, connection, and status using wpa_cli
 Works with wpa_supplicant on Raspberry Pi OS (no NetworkManager needed)
 """
+import csv
+import fcntl
+import io
+import socket
+import struct
 import subprocess
+from operator import attrgetter
 import re
 import time
-from typing import Optional, Dict, List
+from typing import NamedTuple, Optional, Dict, List
+
+from io_singletons import IO_POOL
+
+
+class Network(NamedTuple):
+    """One scanned access point; lighter than a per-row dict"""
+    ssid: str
+    bssid: str
+    frequency: int
+    signal_dbm: int
+    signal_percent: int
+    security: str
+    secured: bool
+    flags: str
+
+    def to_dict(self) -> Dict:
+        """Dict form for the JSON boundary"""
+        return self._asdict()
 
 
 class WiFiService:
@@ -15,10 +39,40 @@ class WiFiService:
     INTERFACE = "wlan0"
     SCAN_TIMEOUT = 10
     CONNECT_TIMEOUT = 30
+    SCAN_POLL_INTERVAL = 0.2
+    SCAN_POLL_TIMEOUT = 5.0
+
+    # One pass over scan_results: bssid, frequency, signal, flags, ssid.
+    # Flags never contain tabs; the SSID field may, so it takes the rest
+    # of the line
+    _SCAN_RE = re.compile(
+        r'^([0-9a-f:]{17})\t(\d+)\t(-?\d+)\t([^\t\n]*)\t(.*)$',
+        re.MULTILINE
+    )
+    _IP_RE = re.compile(r'inet (\d+\.\d+\.\d+\.\d+)')
+    _SIGNAL_RE = re.compile(r'Signal level[=:](-?\d+)')
+    _SIOCGIFADDR = 0x8915
+    _PROC_WIRELESS = "/proc/net/wireless"
     
     def __init__(self, interface: str = None):
         self.interface = interface or self.INTERFACE
+        # get_status is polled ~1Hz by the UI but spawns three processes;
+        # a 1s TTL collapses a poll burst into one real check
+        self._status_cache = None
+        self._status_cache_ts = 0.0
     
+    @staticmethod
+    def _parse_tsv(output: str, min_cols: int) -> List[List[str]]:
+        """Parse wpa_cli's tab-separated output, skipping the header row
+
+        csv.reader tokenizes at C level; QUOTE_NONE keeps SSIDs containing
+        quote characters intact.
+        """
+        reader = csv.reader(io.StringIO(output), delimiter='\t',
+                            quoting=csv.QUOTE_NONE)
+        next(reader, None)
+        return [row for row in reader if len(row) >= min_cols]
+
     def _run_cmd(self, cmd: List[str], timeout: int = 10) -> tuple:
         """Run a shell command and return (success, output)"""
         try:
@@ -40,9 +94,36 @@ class WiFiService:
         """Run wpa_cli with multiple arguments"""
         cmd = ["/usr/bin/sudo", "/usr/sbin/wpa_cli", "-i", self.interface] + list(args)
         return self._run_cmd(cmd, timeout)
+
+    def _wpa_cli_batch(self, commands: List[str], timeout: int = 10) -> tuple:
+        """Run several wpa_cli commands through one interactive process
+
+        Each fork+exec of sudo wpa_cli costs tens of milliseconds on a Pi;
+        feeding the commands to one interactive session collapses that to a
+        single spawn. Returns (success, combined output).
+        """
+        try:
+            proc = subprocess.Popen(
+                ["/usr/bin/sudo", "/usr/sbin/wpa_cli", "-i", self.interface],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE, text=True
+            )
+            output, _ = proc.communicate(
+                "\n".join(commands) + "\nquit\n", timeout=timeout
+            )
+            return proc.returncode == 0, output.strip()
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            return False, "Command timed out"
+        except Exception as e:
+            return False, str(e)
     
     def get_status(self) -> Dict:
         """Get current WiFi connection status"""
+        if (self._status_cache is not None
+                and time.monotonic() - self._status_cache_ts < 1.0):
+            return self._status_cache
+
         try:
             success, output = self._wpa_cli("status")
             
@@ -60,18 +141,22 @@ class WiFiService:
             if status.get('wpa_state') == 'COMPLETED':
                 status['connected'] = True
                 status['ssid'] = status.get('ssid', 'Unknown')
-                
-                # Get IP address
-                ip = self._get_ip_address()
+
+                # IP and signal strength come from independent forks, so
+                # run them concurrently - wall time becomes the slower one
+                ip_future = IO_POOL.submit(self._get_ip_address)
+                signal = self._get_signal_strength()
+                ip = ip_future.result()
+
                 if ip:
                     status['ip_address'] = ip
-                
-                # Get signal strength
-                signal = self._get_signal_strength()
+
                 if signal is not None:
                     status['signal_strength'] = signal
                     status['signal_percent'] = self._dbm_to_percent(signal)
-            
+
+            self._status_cache = status
+            self._status_cache_ts = time.monotonic()
             return status
             
         except Exception as e:
@@ -79,12 +164,25 @@ class WiFiService:
     
     def _get_ip_address(self) -> Optional[str]:
         """Get the IP address of the WiFi interface"""
+        # Ask the kernel directly - no process spawn. Fails with OSError
+        # when the interface is down or has no address
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                packed = fcntl.ioctl(
+                    s.fileno(), self._SIOCGIFADDR,
+                    struct.pack('256s', self.interface[:15].encode())
+                )
+            return socket.inet_ntoa(packed[20:24])
+        except OSError:
+            pass
+
+        # Fall back to forking ip(8)
         try:
             success, output = self._run_cmd([
                 "/usr/sbin/ip", "-4", "addr", "show", self.interface
             ])
             if success:
-                match = re.search(r'inet (\d+\.\d+\.\d+\.\d+)', output)
+                match = self._IP_RE.search(output)
                 if match:
                     return match.group(1)
         except:
@@ -93,12 +191,24 @@ class WiFiService:
     
     def _get_signal_strength(self) -> Optional[int]:
         """Get signal strength in dBm"""
+        # /proc/net/wireless exposes the same level iwconfig prints;
+        # reading it is a tiny file read instead of a fork+exec
+        try:
+            with open(self._PROC_WIRELESS) as f:
+                for line in f:
+                    if line.lstrip().startswith(self.interface + ':'):
+                        # iface: status, link quality, signal level, noise...
+                        return int(float(line.split()[3]))
+        except (OSError, ValueError, IndexError):
+            pass
+
+        # Fall back to forking iwconfig
         try:
             success, output = self._run_cmd([
                 "/usr/sbin/iwconfig", self.interface
             ])
             if success:
-                match = re.search(r'Signal level[=:](-?\d+)', output)
+                match = self._SIGNAL_RE.search(output)
                 if match:
                     return int(match.group(1))
         except:
@@ -114,59 +224,81 @@ class WiFiService:
         else:
             return 2 * (dbm + 100)
     
-    def scan_networks(self) -> List[Dict]:
+    def scan_networks(self) -> List[Network]:
         """Scan for available WiFi networks"""
         try:
+            # wpa_supplicant keeps serving the previous scan's list while
+            # a new scan runs, so stable output alone does not mean the
+            # scan finished. Snapshot the stale list first and poll until
+            # the output changes from it; if nothing changes inside the
+            # window, return whatever is there
+            success, before = self._wpa_cli("scan_results")
+            if not success:
+                before = None
+
             # Trigger scan
             success, _ = self._wpa_cli("scan")
             if not success:
                 return []
-            
-            # Wait for scan to complete
-            time.sleep(3)
-            
-            # Get scan results
-            success, output = self._wpa_cli("scan_results")
-            if not success:
+
+            output = before
+            deadline = time.monotonic() + self.SCAN_POLL_TIMEOUT
+            while time.monotonic() < deadline:
+                time.sleep(self.SCAN_POLL_INTERVAL)
+                success, current = self._wpa_cli("scan_results")
+                if not success:
+                    return []
+                output = current
+                if current != before:
+                    break
+
+            if not output:
                 return []
             
-            networks = []
-            seen_ssids = set()
-            
-            lines = output.split('\n')[1:]  # Skip header
-            for line in lines:
-                parts = line.split('\t')
-                if len(parts) >= 5:
-                    bssid, freq, signal, flags, ssid = parts[0], parts[1], parts[2], parts[3], '\t'.join(parts[4:])
-                    
-                    # Skip hidden networks and duplicates
-                    if not ssid or ssid in seen_ssids:
-                        continue
-                    
-                    seen_ssids.add(ssid)
-                    
-                    # Determine security type
+            # An SSID usually appears once per BSSID; keep the strongest
+            # signal per SSID instead of whichever line happened to be first.
+            # The precompiled pattern skips the header line (no MAC) and
+            # replaces the per-line split/join dance with one C-level pass
+            best = {}
+
+            for match in self._SCAN_RE.finditer(output):
+                bssid, freq, signal, flags, ssid = match.groups()
+
+                # Skip hidden networks
+                if not ssid:
+                    continue
+
+                signal_dbm = int(signal)
+                current = best.get(ssid)
+                if current is not None and current.signal_dbm >= signal_dbm:
+                    continue
+
+                # Determine security type. Mixed-mode APs list WPA
+                # before WPA2 ([WPA-PSK-...][WPA2-PSK-...]), so WPA2 must
+                # be tested against the whole string first
+                if "WPA2" in flags:
+                    security = "WPA2"
+                elif "WPA" in flags:
+                    security = "WPA"
+                elif "WEP" in flags:
+                    security = "WEP"
+                else:
                     security = "Open"
-                    if "WPA2" in flags:
-                        security = "WPA2"
-                    elif "WPA" in flags:
-                        security = "WPA"
-                    elif "WEP" in flags:
-                        security = "WEP"
-                    
-                    networks.append({
-                        "ssid": ssid,
-                        "bssid": bssid,
-                        "frequency": int(freq),
-                        "signal_dbm": int(signal),
-                        "signal_percent": self._dbm_to_percent(int(signal)),
-                        "security": security,
-                        "secured": security != "Open",
-                        "flags": flags
-                    })
-            
+
+                best[ssid] = Network(
+                    ssid=ssid,
+                    bssid=bssid,
+                    frequency=int(freq),
+                    signal_dbm=signal_dbm,
+                    signal_percent=self._dbm_to_percent(signal_dbm),
+                    security=security,
+                    secured=security != "Open",
+                    flags=flags
+                )
+
             # Sort by signal strength
-            networks.sort(key=lambda x: x['signal_dbm'], reverse=True)
+            networks = sorted(best.values(), key=attrgetter('signal_dbm'),
+                              reverse=True)
             
             print(f"Found {len(networks)} WiFi networks")
             return networks
@@ -178,49 +310,47 @@ class WiFiService:
     def connect(self, ssid: str, password: str = None) -> Dict:
         """Connect to a WiFi network"""
         try:
+            # The credentials are embedded in the batched wpa_cli command
+            # stream, where a newline would let one field inject further
+            # control commands; argv-based calls never had that problem
+            if ('\n' in ssid or '\r' in ssid or (
+                    password and ('\n' in password or '\r' in password))):
+                return {"success": False,
+                        "error": "Invalid characters in SSID or password"}
+
             # Check if network already configured
             network_id = self._find_network(ssid)
             
+            commands = []
             if network_id is None:
-                # Add new network
+                # Add new network; its id is needed for the commands below,
+                # so this one still runs on its own
                 success, output = self._wpa_cli("add_network")
                 if not success or not output.isdigit():
                     return {"success": False, "error": "Failed to add network"}
-                
+
                 network_id = output
-                
-                # Set SSID
-                success, _ = self._wpa_cli_args(
-                    "set_network", network_id, "ssid", f'"{ssid}"'
-                )
-                if not success:
-                    return {"success": False, "error": "Failed to set SSID"}
-                
-                # Set password or open network
+
+                commands.append(f'set_network {network_id} ssid "{ssid}"')
                 if password:
-                    success, _ = self._wpa_cli_args(
-                        "set_network", network_id, "psk", f'"{password}"'
-                    )
-                    if not success:
-                        return {"success": False, "error": "Failed to set password"}
+                    commands.append(f'set_network {network_id} psk "{password}"')
                 else:
-                    success, _ = self._wpa_cli_args(
-                        "set_network", network_id, "key_mgmt", "NONE"
-                    )
-                    if not success:
-                        return {"success": False, "error": "Failed to configure open network"}
-            
-            # Enable and select the network
-            self._wpa_cli_args("enable_network", network_id)
-            success, _ = self._wpa_cli_args("select_network", network_id)
-            
-            if not success:
-                return {"success": False, "error": "Failed to select network"}
-            
-            # Save config
-            self._wpa_cli("save_config")
+                    commands.append(f'set_network {network_id} key_mgmt NONE')
+
+            # Configure, enable, select and save in a single wpa_cli spawn
+            commands += [
+                f"enable_network {network_id}",
+                f"select_network {network_id}",
+                "save_config",
+            ]
+            success, output = self._wpa_cli_batch(commands)
+
+            if not success or "FAIL" in output:
+                return {"success": False, "error": "Failed to configure network"}
             
-            # Wait for connection
+            # Wait for connection; drop the status cache first so the
+            # poll sees the association in progress, not pre-connect state
+            self._status_cache = None
             for i in range(self.CONNECT_TIMEOUT // 2):
                 time.sleep(2)
                 status = self.get_status()
@@ -243,9 +373,8 @@ class WiFiService:
             if not success:
                 return None
             
-            for line in output.split('\n')[1:]:  # Skip header
-                parts = line.split('\t')
-                if len(parts) >= 2 and parts[1] == ssid:
+            for parts in self._parse_tsv(output, 2):
+                if parts[1] == ssid:
                     return parts[0]
             
             return None
@@ -256,6 +385,7 @@ class WiFiService:
         """Disconnect from current network"""
         try:
             success, _ = self._wpa_cli("disconnect")
+            self._status_cache = None
             return {"success": success}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -283,16 +413,14 @@ class WiFiService:
                 return []
             
             networks = []
-            for line in output.split('\n')[1:]:  # Skip header
-                parts = line.split('\t')
-                if len(parts) >= 4:
-                    networks.append({
-                        "id": parts[0],
-                        "ssid": parts[1],
-                        "bssid": parts[2],
-                        "flags": parts[3],
-                        "current": "[CURRENT]" in parts[3]
-                    })
+            for parts in self._parse_tsv(output, 4):
+                networks.append({
+                    "id": parts[0],
+                    "ssid": parts[1],
+                    "bssid": parts[2],
+                    "flags": parts[3],
+                    "current": "[CURRENT]" in parts[3]
+                })
             
             return networks
         except:
@@ -316,7 +444,7 @@ if __name__ == "__main__":
     print("\n2. Scanning Networks...")
     networks = wifi.scan_networks()
     for net in networks[:5]:
-        print(f"   {net['ssid']}: {net['signal_percent']}% ({net['security']})")
+        print(f"   {net.ssid}: {net.signal_percent}% ({net.security})")
     
     print("\n3. Saved Networks:")
     saved = wifi.get_saved_networks()
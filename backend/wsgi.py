@@ -0,0 +1,5 @@
+"""
+WSGI entry point for production
+Run with: gunicorn -k gevent -w 2 --worker-connections 100 -b 0.0.0.0:5000 wsgi:app
+"""
+from app import app  # noqa: F401
@@ -87,7 +87,7 @@ Type=simple
 User=${SERVICE_USER}
 WorkingDirectory=${INSTALL_DIR}/backend
 Environment="PATH=${INSTALL_DIR}/venv/bin"
-ExecStart=${INSTALL_DIR}/venv/bin/python app.py
+ExecStart=${INSTALL_DIR}/venv/bin/gunicorn -k gevent -w 2 --worker-connections 100 -b 0.0.0.0:5000 wsgi:app
 Restart=always
 RestartSec=10
 